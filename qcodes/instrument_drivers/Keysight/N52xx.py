@@ -9,7 +9,7 @@ from qcodes import (VisaInstrument, InstrumentChannel, ArrayParameter,
                     ChannelList)
 from qcodes.utils.validators import Ints, Numbers, Enum, Bool
 
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
 class PNASweep(ArrayParameter):
     def __init__(self,
@@ -1,11 +1,16 @@
 import re
 import warnings
+from contextlib import contextmanager
 from functools import wraps
 
 from qcodes import VisaInstrument
 from qcodes.utils.validators import MultiType, Ints, Enum, Lists
 from typing import List, Tuple, Callable
 
+_CHANNEL_LIST_PATTERN = re.compile(
+    r'(?P<card>\d{0,1}?)(?P<input>\d{1,2})(?P<output>\d{2})(?=('
+    r'?:[,\)\r\n]|$))')
+
 
 def post_execution_status_poll(func: Callable) -> Callable:
     """
@@ -18,6 +23,11 @@ def post_execution_status_poll(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
+        if getattr(self, '_deferring_status_poll', False):
+            # a single status poll is performed by `deferred_status_poll`
+            # around the whole block instead of around every call
+            return func(self, *args, **kwargs)
+
         self.clear_status()
         retval = func(self, *args, **kwargs)
 
@@ -51,6 +61,7 @@ class KeysightB220X(VisaInstrument):
         super().__init__(name, address, terminator='\n', **kwargs)
 
         self._card = 0
+        self._deferring_status_poll = False
 
         self.add_parameter(name='get_status',
                            get_cmd='*ESR?',
@@ -319,6 +330,28 @@ class KeysightB220X(VisaInstrument):
         """
         self.write(':COUP:PORT:DET')
 
+    @contextmanager
+    def deferred_status_poll(self):
+        """
+        Context manager that suspends the per-call status polling done by
+        `post_execution_status_poll` and polls only once around the whole
+        block. This collapses the `*CLS`/`*ESR?` round-trips of a sequence
+        of N calls from 3N to N+2, at the cost of not knowing which call
+        in the block caused an error.
+        """
+        self.clear_status()
+        self._deferring_status_poll = True
+        try:
+            yield
+        finally:
+            self._deferring_status_poll = False
+            stb = self.get_status()
+            if stb:
+                warnings.warn(f"Instrument status byte indicates an error "
+                              f"occured (value of STB was: {stb})! Use "
+                              f"`get_error` method to poll error message.",
+                              stacklevel=2)
+
     def clear_status(self):
         """Clears status register and error queue of the instrument."""
         self.write('*CLS')
@@ -347,10 +380,8 @@ class KeysightB220X(VisaInstrument):
         """Generate a set of (input, output) tuples from a SCPI channel
         list string.
         """
-        pattern = r'(?P<card>\d{0,1}?)(?P<input>\d{1,2})(?P<output>\d{2})(?=(' \
-                  r'?:[,\)\r\n]|$))'
         return {(int(match['input']), int(match['output'])) for match in
-                re.finditer(pattern, channel_list)}
+                _CHANNEL_LIST_PATTERN.finditer(channel_list)}
 
     def to_channel_list(self, paths: List[Tuple[int, int]]):
         l = [f'{self._card:01d}{i:02d}{o:02d}' for i, o in paths]
@@ -1,9 +1,9 @@
 from qcodes import (VisaInstrument, Instrument, validators as vals)
-import math
+import asyncio
 import struct
+import numpy as np
 from datetime import datetime
-
-date_obj = str(datetime.now())[:10]+';'+str(datetime.now())[11:]
+from functools import partial
 
 class RohdeSchwarz_SMBV100A(VisaInstrument):
     """Driver class for a Rohde&Schwarz SMBV100A vector signal generator""" 
@@ -55,7 +55,10 @@ class RohdeSchwarz_SMBV100A(VisaInstrument):
 
     def write_full_file(self, target_file, file_data):
         """Creates file containing file_data at address given by target_file, overwriting if file already exists"""
-        self.write('BB:ARB:WAV:DATA "{}", #{}{}{}'.format(target_file, len(str(len(file_data))), len(file_data), file_data))
+        payload = file_data.encode('latin-1') if isinstance(file_data, str) else bytes(file_data)
+        lenstr = str(len(payload))
+        header = 'BB:ARB:WAV:DATA "{}", #{}{}'.format(target_file, len(lenstr), lenstr).encode('ascii')
+        self.visa_handle.write_raw(header + payload)
     
     def write_file(self, filename, I_list, Q_list, clock, marker1 = None, marker2 = None):
         """
@@ -71,24 +74,44 @@ class RohdeSchwarz_SMBV100A(VisaInstrument):
         The first start_sample should be 0.\n
         marker2: see marker1
         """
-        while len(Q_list)<len(I_list):
-            Q_list.append(I_list[len(Q_list)])      # if Q_list shorter than I_list, it is made up to the full length using I value for the same point in the waveform
-        if len(Q_list)>len(I_list):
-            Q_list = Q_list[:len(I_list)]
+        n = len(I_list)
+        if len(Q_list) < n:
+            Q_list = list(Q_list) + list(I_list[len(Q_list):n])     # if Q_list shorter than I_list, it is made up to the full length using I value for the same point in the waveform
+        elif len(Q_list) > n:
+            Q_list = Q_list[:n]
         wavelength = int(4*len(I_list)+1)
+        I = np.asarray(I_list, dtype=np.float64)
+        Q = np.asarray(Q_list, dtype=np.float64)
+        if I.size and max(np.abs(I).max(), np.abs(Q).max()) > 1:
+            raise ValueError("Entry must be a float or integer between -1 and 1")
         rms_offs = 0
-        if all(I_list[i] + Q_list[i] == 0 for i in range(len(I_list))) == False:
-            rms_offs = -10*math.log10(math.sqrt(sum([(I_list[i]+Q_list[i]/2)**2 for i in range(len(I_list))])/len(I_list)))
-        waveform = ''.join(DACl(I_list[i])+DACl(Q_list[i]) for i in range(len(I_list)))
-        entries = ["{TYPE: SMU-WV, %s}" %self.checksum(I_list, Q_list), "{CLOCK: %d}" %clock, "{DATE: %s}" %date_obj, 
+        if np.any(I + Q):
+            rms_offs = float(-10*np.log10(np.sqrt(np.mean((I + Q/2)**2))))
+        iq = np.empty(2*I.size, dtype='<i2')        # scaled int16 samples, I and Q interleaved
+        iq[0::2] = np.round(32767*I)
+        iq[1::2] = np.round(32767*Q)
+        date_obj = datetime.now().strftime('%Y-%m-%d;%H:%M:%S')
+        entries = ["{TYPE: SMU-WV, %s}" %self.checksum(I_list, Q_list), "{CLOCK: %d}" %clock, "{DATE: %s}" %date_obj,
                    "{LEVEL OFFS: 0.0, 0.0}", "{CRESTFACTOR: %s}" %rms_offs, "{SAMPLES: %d}" %len(I_list)]
         if marker1 != None:
             entries.append("{MARKER LIST 1: %s}" %"; ".join(marker1))
         if marker2 != None:
             entries.append("{MARKER LIST 2: %s}" %"; ".join(marker2))
-        entries.append("{WAVEFORM-%s: #%s}" %(wavelength, waveform))
-        data = ''.join(entries)
-        self.write('BB:ARB:WAV:DATA "{}", #{}{}{}'.format(filename, len(str(len(data))), len(data), data))
+        entries.append("{WAVEFORM-%s: #" %wavelength)
+        data = ''.join(entries).encode('ascii') + iq.tobytes() + b'}'
+        lenstr = str(len(data))
+        header = 'BB:ARB:WAV:DATA "{}", #{}{}'.format(filename, len(lenstr), lenstr).encode('ascii')
+        self.visa_handle.write_raw(header + data)
+
+    async def awrite_raw(self, payload):
+        """Asynchronous raw write. Runs the blocking VISA transfer in an executor so that other instruments can be driven while a large waveform is being sent."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.visa_handle.write_raw, payload)
+
+    async def awrite_file(self, filename, I_list, Q_list, clock, marker1 = None, marker2 = None):
+        """Asynchronous version of write_file. See write_file for the meaning of the arguments."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(self.write_file, filename, I_list, Q_list, clock, marker1, marker2))
 
     def read_file(self, target_file, tag_name):
         """Returns the contents of the named tag in target_file"""
@@ -112,10 +135,10 @@ class RohdeSchwarz_SMBV100A(VisaInstrument):
     
     def file_from_data_list(self, target_file, data_list):
         """Writes waveform data to a new file. Data_list should be a list of real numbers from [-1,1]. set_clock method must be used to assign a sample frequency to the wave."""
-        scaled_list = [round(32767*element) for element in data_list]
-        full_signal = str(hex(sum(element*16**(4*len(scaled_list)-4*index-4) for index, element in enumerate(scaled_list))))
-        waveform = bytearray.fromhex(full_signal[2:]).decode('latin-1')
-        self.write('MMEM:DATA:UNPR "NVWFM:{}", #{}{}{}'.format(target_file, len(str(len(waveform))), len(waveform), waveform))
+        waveform = np.round(32767*np.asarray(data_list, dtype=np.float64)).astype('>i2').tobytes()
+        lenstr = str(len(waveform))
+        header = 'MMEM:DATA:UNPR "NVWFM:{}", #{}{}'.format(target_file, len(lenstr), lenstr).encode('ascii')
+        self.visa_handle.write_raw(header + waveform)
 
     def set_clock(self, filename, frequency):
         """Assigns a sample frequency to given file"""
@@ -123,25 +146,20 @@ class RohdeSchwarz_SMBV100A(VisaInstrument):
 
     def checksum(self, I_list, Q_list):
         """Calculates a checksum from a list of integers in the interval [-1,1] according to the R&S algorithm, to be used by the SMBV100A to check the data is uncorrupted."""
-        nonhex_list = [[round(32767*entry) if round(32767*entry) >= 0 else 65536 + round(32767*entry) for entry in pair] for pair in zip(I_list, Q_list)]
-        hex_list = [[hex(item)[2:].rjust(4, '0') for item in pair] for pair in nonhex_list]
-        swap_list = [[item[2:]+item[:2] for item in pair] for pair in hex_list]
-        value_list = [int(pair[0]+pair[1], 16) for pair in swap_list]
-        result = 0xA50F74FF
-        for item in value_list:
-            result = result^item
-        return result
+        I = np.asarray(I_list, dtype=np.float64)
+        Q = np.asarray(Q_list, dtype=np.float64)
+        n = min(I.size, Q.size)
+        iq = np.empty(2*n, dtype='<i2')        # int16 cast wraps negative samples to two's complement
+        iq[0::2] = np.round(32767*I[:n])
+        iq[1::2] = np.round(32767*Q[:n])
+        # each 32-bit word is made of the byte-swapped I and Q sample, which on this
+        # little-endian int16 stream amounts to a big-endian 32-bit read
+        words = np.frombuffer(iq.tobytes(), dtype='>u4')
+        return int(np.bitwise_xor.reduce(words, initial=np.uint32(0xA50F74FF)))
 
 def DACl(num):
     """Multiplies num by 32767, and converts the result to text using latin-1 encoding in little-endian format."""
-    if round(32767*num) >=0 and num <= 1:
-        entry = round(32767*num)        
-    elif round(32767*num) < 0 and num >= -1:
-        entry = 65536 + round(32767*num)
-    else:
+    if not -1 <= num <= 1:
         raise ValueError("Entry must be a float or integer between -1 and 1")
-    mid = hex(entry)[2:].rjust(4, '0')
-    if len(mid)%2 != 0:
-        mid = '0' + mid
-    result = bytearray.fromhex(''.join([mid[2*i:2*i+2] for i in range(int(len(mid)/2)-1, -1, -1)])).decode('latin-1')
-    return result
+    # masking to 16 bits is the same two's-complement wrap the old sign branch performed
+    return struct.pack('<H', round(32767*num) & 0xFFFF).decode('latin-1')
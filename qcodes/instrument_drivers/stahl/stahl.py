@@ -12,7 +12,7 @@ from functools import partial
 from qcodes import VisaInstrument, InstrumentChannel, ChannelList
 from qcodes.utils.validators import Numbers
 
-logger = logging.getLogger()
+logger = logging.getLogger(__name__)
 
 
 def chain(*functions: Callable) -> Callable:
@@ -9,38 +9,55 @@ from qcodes.dataset.sqlite.database import connect
 from qcodes.tests.common import error_caused_by
 
 
+def n_runs(conn) -> int:
+    """Number of rows in the runs table, counted inside sqlite itself"""
+    return conn.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+
+
+@pytest.fixture
+def sqlite_conn():
+    """A fresh in-memory sqlite3 connection that is closed on teardown"""
+    conn = sqlite3.connect(':memory:')
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _conn_snapshot(conn):
+    """
+    Single snapshot of the connection attributes that the helpers below
+    assert on; these helpers run many times inside the nested-atomic tests
+    """
+    return (conn.in_transaction, conn.isolation_level,
+            getattr(conn, 'atomic_in_progress', None))
+
+
 def sqlite_conn_in_transaction(conn: sqlite3.Connection):
     assert isinstance(conn, sqlite3.Connection)
-    assert True is conn.in_transaction
-    assert None is conn.isolation_level
+    assert (True, None, None) == _conn_snapshot(conn)
     return True
 
 
 def conn_plus_in_transaction(conn: ConnectionPlus):
     assert isinstance(conn, ConnectionPlus)
-    assert True is conn.atomic_in_progress
-    assert None is conn.isolation_level
-    assert True is conn.in_transaction
+    assert (True, None, True) == _conn_snapshot(conn)
     return True
 
 
 def sqlite_conn_is_idle(conn: sqlite3.Connection, isolation=None):
     assert isinstance(conn, sqlite3.Connection)
-    assert False is conn.in_transaction
-    assert isolation == conn.isolation_level
+    assert (False, isolation, None) == _conn_snapshot(conn)
     return True
 
 
 def conn_plus_is_idle(conn: ConnectionPlus, isolation=None):
     assert isinstance(conn, ConnectionPlus)
-    assert False is conn.atomic_in_progress
-    assert isolation == conn.isolation_level
-    assert False is conn.in_transaction
+    assert (False, isolation, False) == _conn_snapshot(conn)
     return True
 
 
-def test_connection_plus():
-    sqlite_conn = sqlite3.connect(':memory:')
+def test_connection_plus(sqlite_conn):
     conn_plus = ConnectionPlus(sqlite_conn)
 
     assert conn_plus.path_to_dbfile == ''
@@ -54,18 +71,17 @@ def test_connection_plus():
         ConnectionPlus(conn_plus)
 
 
-def test_make_connection_plus_from_sqlite3_connection():
-    conn = sqlite3.connect(':memory:')
-    conn_plus = make_connection_plus_from(conn)
+def test_make_connection_plus_from_sqlite3_connection(sqlite_conn):
+    conn_plus = make_connection_plus_from(sqlite_conn)
 
     assert conn_plus.path_to_dbfile == ''
     assert isinstance(conn_plus, ConnectionPlus)
     assert False is conn_plus.atomic_in_progress
-    assert conn_plus is not conn
+    assert conn_plus is not sqlite_conn
 
 
-def test_make_connection_plus_from_connecton_plus():
-    conn = ConnectionPlus(sqlite3.connect(':memory:'))
+def test_make_connection_plus_from_connecton_plus(sqlite_conn):
+    conn = ConnectionPlus(sqlite_conn)
     conn_plus = make_connection_plus_from(conn)
 
     assert conn_plus.path_to_dbfile == ''
@@ -74,8 +90,7 @@ def test_make_connection_plus_from_connecton_plus():
     assert conn_plus is conn
 
 
-def test_atomic():
-    sqlite_conn = sqlite3.connect(':memory:')
+def test_atomic(sqlite_conn):
 
     match_str = re.escape('atomic context manager only accepts ConnectionPlus '
                           'database connection objects.')
@@ -104,8 +119,7 @@ def test_atomic():
     assert atomic_in_progress is atomic_conn.atomic_in_progress
 
 
-def test_atomic_with_exception():
-    sqlite_conn = sqlite3.connect(':memory:')
+def test_atomic_with_exception(sqlite_conn):
     conn_plus = ConnectionPlus(sqlite_conn)
 
     sqlite_conn.execute('PRAGMA user_version(25)')
@@ -123,8 +137,8 @@ def test_atomic_with_exception():
     assert 25 == sqlite_conn.execute('PRAGMA user_version').fetchall()[0][0]
 
 
-def test_atomic_on_outmost_connection_that_is_in_transaction():
-    conn = ConnectionPlus(sqlite3.connect(':memory:'))
+def test_atomic_on_outmost_connection_that_is_in_transaction(sqlite_conn):
+    conn = ConnectionPlus(sqlite_conn)
 
     conn.execute('BEGIN')
     assert True is conn.in_transaction
@@ -138,8 +152,8 @@ def test_atomic_on_outmost_connection_that_is_in_transaction():
 
 
 @pytest.mark.parametrize('in_transaction', (True, False))
-def test_atomic_on_connection_plus_that_is_in_progress(in_transaction):
-    sqlite_conn = sqlite3.connect(':memory:')
+def test_atomic_on_connection_plus_that_is_in_progress(sqlite_conn,
+                                                       in_transaction):
     conn_plus = ConnectionPlus(sqlite_conn)
 
     # explicitly set to True for testing purposes
@@ -171,8 +185,7 @@ def test_atomic_on_connection_plus_that_is_in_progress(in_transaction):
     assert in_transaction is atomic_conn.in_transaction
 
 
-def test_two_nested_atomics():
-    sqlite_conn = sqlite3.connect(':memory:')
+def test_two_nested_atomics(sqlite_conn):
     conn_plus = ConnectionPlus(sqlite_conn)
 
     atomic_in_progress = conn_plus.atomic_in_progress
@@ -220,17 +233,19 @@ def test_that_use_of_atomic_commits_only_at_outermost_context(
     conn_plus = create_conn_plus(sqlite_conn)
 
     # this connection is going to be used to test whether changes have been
-    # committed to the database file
+    # committed to the database file; WAL mode lets it read the last
+    # committed state without blocking on the writer's open transaction
     control_conn = connect(dbfile)
+    control_conn.execute('PRAGMA journal_mode=WAL')
+    control_conn.execute('PRAGMA synchronous=NORMAL')
 
-    get_all_runs = 'SELECT * FROM runs'
     insert_run_with_name = 'INSERT INTO runs (name) VALUES (?)'
 
     # assert that at the beginning of the test there are no runs in the
     # table; we'll be adding new rows to the runs table below
 
-    assert 0 == len(conn_plus.execute(get_all_runs).fetchall())
-    assert 0 == len(control_conn.execute(get_all_runs).fetchall())
+    assert 0 == n_runs(conn_plus)
+    assert 0 == n_runs(control_conn)
 
     # add 1 new row, and assert the state of the runs table at every step
     # note that control_conn will only detect the change after the `atomic`
@@ -238,19 +253,19 @@ def test_that_use_of_atomic_commits_only_at_outermost_context(
 
     with atomic(conn_plus) as atomic_conn:
 
-        assert 0 == len(conn_plus.execute(get_all_runs).fetchall())
-        assert 0 == len(atomic_conn.execute(get_all_runs).fetchall())
-        assert 0 == len(control_conn.execute(get_all_runs).fetchall())
+        assert 0 == n_runs(conn_plus)
+        assert 0 == n_runs(atomic_conn)
+        assert 0 == n_runs(control_conn)
 
         atomic_conn.cursor().execute(insert_run_with_name, ['aaa'])
 
-        assert 1 == len(conn_plus.execute(get_all_runs).fetchall())
-        assert 1 == len(atomic_conn.execute(get_all_runs).fetchall())
-        assert 0 == len(control_conn.execute(get_all_runs).fetchall())
+        assert 1 == n_runs(conn_plus)
+        assert 1 == n_runs(atomic_conn)
+        assert 0 == n_runs(control_conn)
 
-    assert 1 == len(conn_plus.execute(get_all_runs).fetchall())
-    assert 1 == len(atomic_conn.execute(get_all_runs).fetchall())
-    assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+    assert 1 == n_runs(conn_plus)
+    assert 1 == n_runs(atomic_conn)
+    assert 1 == n_runs(control_conn)
 
     # let's add two new rows but each inside its own `atomic` context manager
     # we expect to see the actual change in the database only after we exit
@@ -258,39 +273,39 @@ def test_that_use_of_atomic_commits_only_at_outermost_context(
 
     with atomic(conn_plus) as atomic_conn_1:
 
-        assert 1 == len(conn_plus.execute(get_all_runs).fetchall())
-        assert 1 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-        assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+        assert 1 == n_runs(conn_plus)
+        assert 1 == n_runs(atomic_conn_1)
+        assert 1 == n_runs(control_conn)
 
         atomic_conn_1.cursor().execute(insert_run_with_name, ['bbb'])
 
-        assert 2 == len(conn_plus.execute(get_all_runs).fetchall())
-        assert 2 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-        assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+        assert 2 == n_runs(conn_plus)
+        assert 2 == n_runs(atomic_conn_1)
+        assert 1 == n_runs(control_conn)
 
         with atomic(atomic_conn_1) as atomic_conn_2:
 
-            assert 2 == len(conn_plus.execute(get_all_runs).fetchall())
-            assert 2 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-            assert 2 == len(atomic_conn_2.execute(get_all_runs).fetchall())
-            assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+            assert 2 == n_runs(conn_plus)
+            assert 2 == n_runs(atomic_conn_1)
+            assert 2 == n_runs(atomic_conn_2)
+            assert 1 == n_runs(control_conn)
 
             atomic_conn_2.cursor().execute(insert_run_with_name, ['ccc'])
 
-            assert 3 == len(conn_plus.execute(get_all_runs).fetchall())
-            assert 3 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-            assert 3 == len(atomic_conn_2.execute(get_all_runs).fetchall())
-            assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+            assert 3 == n_runs(conn_plus)
+            assert 3 == n_runs(atomic_conn_1)
+            assert 3 == n_runs(atomic_conn_2)
+            assert 1 == n_runs(control_conn)
 
-        assert 3 == len(conn_plus.execute(get_all_runs).fetchall())
-        assert 3 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-        assert 3 == len(atomic_conn_2.execute(get_all_runs).fetchall())
-        assert 1 == len(control_conn.execute(get_all_runs).fetchall())
+        assert 3 == n_runs(conn_plus)
+        assert 3 == n_runs(atomic_conn_1)
+        assert 3 == n_runs(atomic_conn_2)
+        assert 1 == n_runs(control_conn)
 
-    assert 3 == len(conn_plus.execute(get_all_runs).fetchall())
-    assert 3 == len(atomic_conn_1.execute(get_all_runs).fetchall())
-    assert 3 == len(atomic_conn_2.execute(get_all_runs).fetchall())
-    assert 3 == len(control_conn.execute(get_all_runs).fetchall())
+    assert 3 == n_runs(conn_plus)
+    assert 3 == n_runs(atomic_conn_1)
+    assert 3 == n_runs(atomic_conn_2)
+    assert 3 == n_runs(control_conn)
 
 
 def test_atomic_transaction(tmp_path):
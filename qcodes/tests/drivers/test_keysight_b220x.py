@@ -119,6 +119,13 @@ def test_disconnect(uut):
     assert 0 == uut.get_status()
 
 
+def test_deferred_status_poll(uut):
+    with uut.deferred_status_poll():
+        uut.connect(2, 48)
+        uut.disconnect(2, 48)
+    assert 0 == uut.get_status()
+
+
 @pytest.mark.filterwarnings("ignore:When going")
 def test_connection_rule(uut):
     uut.connection_rule('single')